@@ -1,10 +1,15 @@
+import importlib
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from skyplane import compute, exceptions
-from skyplane.api.client import SkyplaneClient
+from skyplane import exceptions
 from skyplane.api.config import TransferConfig, AWSConfig, AzureConfig, GCPConfig
-from skyplane.api.dataplane import Dataplane
-from skyplane.api.tracker import TransferHook
+
+if TYPE_CHECKING:
+    from skyplane import compute
+    from skyplane.api.client import SkyplaneClient
+    from skyplane.api.dataplane import Dataplane
+    from skyplane.api.tracker import TransferHook
 
 __version__ = "0.2.1"
 __root__ = Path(__file__).parent.parent
@@ -23,3 +28,21 @@ __all__ = [
     "GCPConfig",
     "TransferHook",
 ]
+
+# attributes that pull in the cloud SDKs are imported on first access (PEP 562) to keep `import skyplane` fast
+_lazy_attrs = {
+    "compute": ("skyplane.compute", None),
+    "SkyplaneClient": ("skyplane.api.client", "SkyplaneClient"),
+    "Dataplane": ("skyplane.api.dataplane", "Dataplane"),
+    "TransferHook": ("skyplane.api.tracker", "TransferHook"),
+}
+
+
+def __getattr__(name):
+    if name in _lazy_attrs:
+        module_name, attr = _lazy_attrs[name]
+        module = importlib.import_module(module_name)
+        value = module if attr is None else getattr(module, attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
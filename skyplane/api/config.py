@@ -1,26 +1,36 @@
+import sys
 from dataclasses import dataclass
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from skyplane import compute
+if TYPE_CHECKING:
+    from skyplane import compute
+
+
+# dataclass(slots=True) is only available on Python 3.10+, older versions fall back to a __dict__ per instance
+_slots = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class AuthenticationConfig:
+    __slots__ = ()
+
     def make_auth_provider(self):
         raise NotImplementedError
 
 
-@dataclass
+@dataclass(**_slots)
 class AWSConfig(AuthenticationConfig):
     aws_access_key: Optional[str] = None
     aws_secret_key: Optional[str] = None
     aws_enabled: bool = True
 
-    def make_auth_provider(self) -> compute.AWSAuthentication:
+    def make_auth_provider(self) -> "compute.AWSAuthentication":
+        from skyplane import compute
+
         return compute.AWSAuthentication(config=self)  # type: ignore
 
 
-@dataclass
+@dataclass(**_slots)
 class AzureConfig(AuthenticationConfig):
     azure_subscription_id: str
     azure_resource_group: str
@@ -29,16 +39,20 @@ class AzureConfig(AuthenticationConfig):
     azure_umi_client_id: str
     azure_enabled: bool = True
 
-    def make_auth_provider(self) -> compute.AzureAuthentication:
+    def make_auth_provider(self) -> "compute.AzureAuthentication":
+        from skyplane import compute
+
         return compute.AzureAuthentication(config=self)  # type: ignore
 
 
-@dataclass
+@dataclass(**_slots)
 class GCPConfig(AuthenticationConfig):
     gcp_project_id: str
     gcp_enabled: bool = True
 
-    def make_auth_provider(self) -> compute.GCPAuthentication:
+    def make_auth_provider(self) -> "compute.GCPAuthentication":
+        from skyplane import compute
+
         return compute.GCPAuthentication(config=self)  # type: ignore
 
 
@@ -528,7 +528,8 @@ class CopyJob(TransferJob):
                 for req in batch:
                     obj_store_interface.complete_multipart_upload(req["key"], req["upload_id"])
 
-            do_parallel(complete_fn, batches, n=-1)
+            # cap in-flight completions at 128 since batch_len rounds down and can yield up to ~2x as many batches
+            do_parallel(complete_fn, batches, n=128)
 
     def verify(self):
         """Verify the integrity of the transfered destination objects"""
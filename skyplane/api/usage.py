@@ -16,7 +16,8 @@ from typing import Optional, Dict
 import skyplane
 from skyplane.utils.definitions import tmp_log_dir
 from skyplane.config import _map_type
-from skyplane.config_paths import config_path, cloud_config, host_uuid_path
+from skyplane import config_paths
+from skyplane.config_paths import config_path, host_uuid_path
 from skyplane.utils import logger, imports
 
 SCHEMA_VERSION = "0.2"
@@ -192,7 +193,7 @@ class UsageClient:
         usage_stats_enabled_config_var = None
         # TODO: Check the correct error
         try:
-            usage_stats_enabled_config_var = cloud_config.get_flag("usage_stats")
+            usage_stats_enabled_config_var = config_paths.cloud_config.get_flag("usage_stats")
         except FileNotFoundError:
             pass
         except Exception as e:
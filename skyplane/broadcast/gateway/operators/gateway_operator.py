@@ -17,7 +17,7 @@ from skyplane.broadcast.gateway.chunk_store import ChunkStore
 from skyplane.broadcast.gateway.gateway_queue import GatewayQueue
 from skyplane.chunk import ChunkRequest
 from skyplane.chunk import ChunkState
-from skyplane.config_paths import cloud_config
+from skyplane import config_paths
 from skyplane.obj_store.object_store_interface import ObjectStoreInterface
 from skyplane.utils import logger
 from skyplane.utils.definitions import MB
@@ -395,7 +395,7 @@ class GatewayObjStoreOperator(GatewayOperator):
         super().__init__(handle, region, input_queue, output_queue, error_event, error_queue, chunk_store, n_processes)
         self.bucket_name = bucket_name
         self.bucket_region = bucket_region
-        self.src_requester_pays = cloud_config.get_flag("requester_pays")
+        self.src_requester_pays = config_paths.cloud_config.get_flag("requester_pays")
 
         # process-local state
         self.worker_id: Optional[int] = None
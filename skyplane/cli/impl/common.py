@@ -8,21 +8,23 @@ from rich import print as rprint
 import typer
 import traceback as tb
 
-from skyplane import compute
 from skyplane.utils import logger
 from skyplane.utils.fn import do_parallel
 
 console = Console()
 
 
-def print_header():
-    header = """ _____ _   ____   _______ _       ___   _   _  _____ 
+_HEADER = """[bright_black] _____ _   ____   _______ _       ___   _   _  _____ 
 /  ___| | / /\ \ / / ___ \ |     / _ \ | \ | ||  ___|
 \ `--.| |/ /  \ V /| |_/ / |    / /_\ \|  \| || |__  
  `--. \    \   \ / |  __/| |    |  _  || . ` ||  __| 
 /\__/ / |\  \  | | | |   | |____| | | || |\  || |___ 
-\____/\_| \_/  \_/ \_|   \_____/\_| |_/\_| \_/\____/"""
-    console.print(f"[bright_black]{header}[/bright_black]\n")
+\____/\_| \_/  \_/ \_|   \_____/\_| |_/\_| \_/\____/[/bright_black]
+"""
+
+
+def print_header():
+    console.print(_HEADER)
 
 
 def print_stats_completed(total_runtime_s: float, throughput_gbits: Optional[float]):
@@ -35,6 +37,8 @@ def print_stats_completed(total_runtime_s: float, throughput_gbits: Optional[flo
 
 
 def query_instances():
+    from skyplane import compute
+
     instances = []
     query_jobs = []
 
@@ -90,11 +90,11 @@ class AWSAuthentication:
     def get_boto3_resource(self, service_name, aws_region=None):
         return self.get_boto3_session().resource(service_name, region_name=aws_region)
 
-    def get_boto3_client(self, service_name, aws_region=None):
+    def get_boto3_client(self, service_name, aws_region=None, config=None):
         if aws_region is None:
-            return self.get_boto3_session().client(service_name)
+            return self.get_boto3_session().client(service_name, config=config)
         else:
-            return self.get_boto3_session().client(service_name, region_name=aws_region)
+            return self.get_boto3_session().client(service_name, region_name=aws_region, config=config)
 
     def get_azs_in_region(self, region):
         ec2 = self.get_boto3_client("ec2", region)
@@ -14,7 +14,7 @@ with warnings.catch_warnings():
     warnings.filterwarnings("ignore", category=CryptographyDeprecationWarning)
 
 from skyplane import exceptions
-from skyplane.config_paths import cloud_config
+from skyplane import config_paths
 from skyplane.compute.azure.azure_auth import AzureAuthentication
 from skyplane.compute.azure.azure_server import AzureServer
 from skyplane.compute.cloud_provider import CloudProvider
@@ -376,10 +376,10 @@ class AzureCloudProvider(CloudProvider):
                                 "user_assigned_identities": [
                                     {
                                         # code from: https://github.com/ray-project/ray/pull/7080/files#diff-0f1bb1da82d112b850a85c1b7b1876e50efd5a7400c62a5c4de334f494d3bf46R222-R233
-                                        "key": f"/subscriptions/{cloud_config.azure_subscription_id}/resourceGroups/skyplane/providers/Microsoft.ManagedIdentity/userAssignedIdentities/skyplane_umi",
+                                        "key": f"/subscriptions/{config_paths.cloud_config.azure_subscription_id}/resourceGroups/skyplane/providers/Microsoft.ManagedIdentity/userAssignedIdentities/skyplane_umi",
                                         "value": {
-                                            "principal_id": cloud_config.azure_principal_id,
-                                            "client_id": cloud_config.azure_client_id,
+                                            "principal_id": config_paths.cloud_config.azure_principal_id,
+                                            "client_id": config_paths.cloud_config.azure_client_id,
                                         },
                                     }
                                 ],
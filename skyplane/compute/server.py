@@ -11,7 +11,8 @@ import urllib3
 from typing import Dict, Optional, Tuple
 
 from skyplane.compute.const_cmds import make_autoshutdown_script, make_dozzle_command, make_sysctl_tcp_tuning_command
-from skyplane.config_paths import config_path, cloud_config, __config_root__
+from skyplane import config_paths
+from skyplane.config_paths import config_path, __config_root__
 from skyplane.utils import logger
 from skyplane.utils.fn import PathLike, wait_for
 from skyplane.utils.retry import retry_backoff
@@ -170,7 +171,7 @@ class Server:
 
     def enable_auto_shutdown(self, timeout_minutes=None):
         if timeout_minutes is None:
-            timeout_minutes = cloud_config.get_flag("autoshutdown_minutes")
+            timeout_minutes = config_paths.cloud_config.get_flag("autoshutdown_minutes")
         self.auto_shutdown_timeout_minutes = timeout_minutes
         self.run_command(f"(echo '{make_autoshutdown_script()}' > /tmp/autoshutdown.sh) && chmod +x /tmp/autoshutdown.sh")
         self.run_command("echo 1")  # run noop to update auto_shutdown
@@ -16,7 +16,9 @@ def load_config_path():
         path = Path(os.environ["SKYPLANE_CONFIG"]).expanduser()
     else:
         path = __config_root__ / "config"
-    path.parent.mkdir(exist_ok=True)
+    # the config directory almost always exists already, so check before attempting the mkdir
+    if not path.parent.is_dir():
+        path.parent.mkdir(exist_ok=True)
     return path
 
 
@@ -31,5 +33,11 @@ def load_cloud_config(path):
 
 
 config_path = load_config_path()
-cloud_config = load_cloud_config(config_path)
 host_uuid_path = __config_root__ / "host_uuid"
+
+
+def __getattr__(name):
+    # cloud_config is loaded on first access (PEP 562) rather than at import, load_cloud_config caches the result
+    if name == "cloud_config":
+        return load_cloud_config(config_path)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,7 +8,7 @@ from multiprocessing import Event, Manager, Process, Value, Queue
 from typing import Dict, Optional
 
 from skyplane.chunk import ChunkRequest
-from skyplane.config_paths import cloud_config
+from skyplane import config_paths
 from skyplane.gateway.chunk_store import ChunkStore
 from skyplane.obj_store.object_store_interface import ObjectStoreInterface
 from skyplane.utils import logger
@@ -28,7 +28,7 @@ class GatewayObjStoreConn:
         self.error_queue = error_queue
         self.n_processes = max_conn
         self.processes = []
-        self.src_requester_pays = cloud_config.get_flag("requester_pays")
+        self.src_requester_pays = config_paths.cloud_config.get_flag("requester_pays")
 
         # shared state
         self.manager = Manager()
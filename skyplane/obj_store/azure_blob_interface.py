@@ -15,7 +15,7 @@ from skyplane.utils import logger, imports
 class AzureBlobObject(ObjectStoreObject):
     def full_path(self):
         account_name, container_name = self.bucket.split("/")
-        return os.path.join(f"https://{account_name}.blob.core.windows.net", container_name, self.key)
+        return f"https://{account_name}.blob.core.windows.net/{container_name}/{self.key}"
 
 
 class AzureBlobInterface(ObjectStoreInterface):
@@ -2,7 +2,7 @@ from functools import lru_cache
 
 from skyplane import exceptions, compute
 from skyplane.utils import logger, imports
-from skyplane.config_paths import cloud_config
+from skyplane import config_paths
 
 
 class AzureStorageAccountInterface:
@@ -28,7 +28,7 @@ class AzureStorageAccountInterface:
             return self.storage_account_obj().location
         except Exception as e:  # user does not have "Storage Account Contributor" role on the storage account
             logger.exception(e)
-            return cloud_config.get_flag("default_azure_region")
+            return config_paths.cloud_config.get_flag("default_azure_region")
 
     @property
     def storage_management_client(self):
@@ -9,7 +9,7 @@ import requests
 from typing import Iterator, List, Optional, Tuple
 
 from skyplane import exceptions, compute
-from skyplane.config_paths import cloud_config
+from skyplane import config_paths
 from skyplane.exceptions import NoSuchObjectException
 from skyplane.obj_store.object_store_interface import ObjectStoreInterface, ObjectStoreObject
 from skyplane.utils import logger
@@ -17,7 +17,7 @@ from skyplane.utils import logger
 
 class GCSObject(ObjectStoreObject):
     def full_path(self):
-        return os.path.join(f"gs://{self.bucket}", self.key)
+        return f"gs://{self.bucket}/{self.key}"
 
 
 class GCSInterface(ObjectStoreInterface):
@@ -49,7 +49,7 @@ class GCSInterface(ObjectStoreInterface):
 
         # load bucket from GCS client
         bucket = None
-        default_region = cloud_config.get_flag("gcp_default_region")
+        default_region = config_paths.cloud_config.get_flag("gcp_default_region")
         try:
             bucket = self._gcs_client.lookup_bucket(self.bucket_name)
         except Exception as e:
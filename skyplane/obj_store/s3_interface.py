@@ -3,12 +3,12 @@ import hashlib
 import os
 from functools import lru_cache
 
-from typing import Iterator, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from skyplane import exceptions, compute
 from skyplane.exceptions import NoSuchObjectException
 from skyplane.obj_store.object_store_interface import ObjectStoreInterface, ObjectStoreObject
-from skyplane.config_paths import cloud_config
+from skyplane import config_paths
 from skyplane.utils import logger, imports
 
 
@@ -18,11 +18,14 @@ class S3Object(ObjectStoreObject):
 
 
 class S3Interface(ObjectStoreInterface):
+    # boto3 clients are thread-safe, so one client (and its connection pool) per region is shared by every
+    # S3Interface in the process. Keyed by pid as well since pooled sockets must not be reused across a fork.
+    _shared_s3_clients: Dict[Tuple[int, str], Any] = {}
+
     def __init__(self, bucket_name: str):
         self.auth = compute.AWSAuthentication()
         self.requester_pays = False
         self.bucket_name = bucket_name
-        self._cached_s3_clients = {}
 
     def path(self):
         return f"s3://{self.bucket_name}"
@@ -31,7 +34,7 @@ class S3Interface(ObjectStoreInterface):
     @lru_cache(maxsize=1)
     def aws_region(self):
         s3_client = self.auth.get_boto3_client("s3")
-        default_region = cloud_config.get_flag("aws_default_region")
+        default_region = config_paths.cloud_config.get_flag("aws_default_region")
         try:
             # None means us-east-1 for legacy reasons
             region = s3_client.get_bucket_location(Bucket=self.bucket_name).get("LocationConstraint", "us-east-1")
@@ -52,11 +55,14 @@ class S3Interface(ObjectStoreInterface):
     def set_requester_bool(self, requester: bool):
         self.requester_pays = requester
 
-    def _s3_client(self, region=None):
+    @imports.inject("botocore.config", pip_extra="aws")
+    def _s3_client(botocore_config, self, region=None):
         region = region if region is not None else self.aws_region
-        if region not in self._cached_s3_clients:
-            self._cached_s3_clients[region] = self.auth.get_boto3_client("s3", region)
-        return self._cached_s3_clients[region]
+        key = (os.getpid(), region)
+        if key not in S3Interface._shared_s3_clients:
+            config = botocore_config.Config(max_pool_connections=max(10, (os.cpu_count() or 1) * 5))
+            S3Interface._shared_s3_clients[key] = self.auth.get_boto3_client("s3", region, config=config)
+        return S3Interface._shared_s3_clients[key]
 
     @imports.inject("botocore.exceptions", pip_extra="aws")
     def bucket_exists(botocore_exceptions, self):
@@ -86,12 +92,8 @@ class S3Interface(ObjectStoreInterface):
         requester_pays = {"RequestPayer": "requester"} if self.requester_pays else {}
         page_iterator = paginator.paginate(Bucket=self.bucket_name, Prefix=prefix, **requester_pays)
         for page in page_iterator:
-            objs = []
             for obj in page.get("Contents", []):
-                objs.append(
-                    S3Object("aws", self.bucket_name, obj["Key"], obj["Size"], obj["LastModified"], mime_type=obj.get("ContentType"))
-                )
-            yield from objs
+                yield S3Object("aws", self.bucket_name, obj["Key"], obj["Size"], obj["LastModified"], mime_type=obj.get("ContentType"))
 
     def delete_objects(self, keys: List[str]):
         s3_client = self._s3_client()
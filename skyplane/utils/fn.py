@@ -1,5 +1,7 @@
+import os
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from rich import print as rprint
@@ -14,36 +16,71 @@ T = TypeVar("T")
 R = TypeVar("R")
 
 
-def wait_for(fn: Callable[[], bool], timeout=60, interval=0.25, desc="Waiting", debug=False) -> Optional[float]:
-    """Wait for fn to return True. Returns number of seconds waited."""
+def wait_for(
+    fn: Callable[[], bool],
+    timeout=60,
+    interval=0.25,
+    desc="Waiting",
+    debug=False,
+    notify_event: Optional[threading.Event] = None,
+) -> Optional[float]:
+    """Wait for fn to return True. Returns number of seconds waited.
+    The poll delay starts at interval and backs off up to max(interval, 0.5s), so fn is never polled more often than
+    every interval. Setting notify_event triggers an immediate re-poll."""
     start = time.time()
+    delay, max_delay = interval, max(interval, 0.5)
     while time.time() - start < timeout:
         if fn() == True:
             logger.fs.debug(f"[wait_for] {desc} fn={fn} completed in {time.time() - start:.2f}s")
             return time.time() - start
-        time.sleep(interval)
+        if notify_event is not None:
+            notify_event.wait(delay)
+            notify_event.clear()
+        else:
+            time.sleep(delay)
+        delay = min(delay * 1.5, max_delay)
     raise TimeoutError(f"Timeout waiting for '{desc}' (timeout {timeout:.2f}s, interval {interval:.2f}s)")
 
 
+def cpu_bound(func: Callable[[T], R]) -> Callable[[T], R]:
+    """Mark func as CPU-bound so that do_parallel(mode="auto") runs it in a process pool."""
+    func._cpu_bound = True  # type: ignore
+    return func
+
+
+def _call_with_args(func: Callable[[T], R], args: T) -> Tuple[T, R]:
+    # module-level (rather than a closure) so that it can be pickled for ProcessPoolExecutor
+    try:
+        return args, func(args)
+    except Exception as e:
+        logger.error(f"Error running {func.__name__}: {e}")
+        raise
+
+
 def do_parallel(
-    func: Callable[[T], R], args_list: Iterable[T], n=-1, desc=None, arg_fmt=None, return_args=True, spinner=False, spinner_persist=False
+    func: Callable[[T], R],
+    args_list: Iterable[T],
+    n=-1,
+    desc=None,
+    arg_fmt=None,
+    return_args=True,
+    spinner=False,
+    spinner_persist=False,
+    mode="thread",
 ) -> List[Union[Tuple[T, R], R]]:
+    """Run func over args_list in parallel. mode is one of "thread", "process" (func and args must be picklable) or
+    "auto" (process if func is decorated with @cpu_bound, thread otherwise)."""
     args_list = list(args_list)
     if len(args_list) == 0:
         return []
 
-    if arg_fmt is None:
-        arg_fmt = lambda x: x.region_tag if hasattr(x, "region_tag") else x
+    if mode == "auto":
+        mode = "process" if getattr(func, "_cpu_bound", False) else "thread"
+    if mode not in ("thread", "process"):
+        raise ValueError(f"Invalid do_parallel mode: {mode}")
 
     if n == -1:
-        n = len(args_list)
-
-    def wrapped_fn(args):
-        try:
-            return args, func(args)
-        except Exception as e:
-            logger.error(f"Error running {func.__name__}: {e}")
-            raise
+        n = len(args_list) if mode == "thread" else min(len(args_list), os.cpu_count() or 1)
 
     results = []
     with Progress(
@@ -51,8 +88,9 @@ def do_parallel(
     ) as progress:
         progress_task = progress.add_task("", total=len(args_list))
         with Timer() as t:
-            with ThreadPoolExecutor(max_workers=n) as executor:
-                future_list = [executor.submit(wrapped_fn, args) for args in args_list]
+            executor_cls = ThreadPoolExecutor if mode == "thread" else ProcessPoolExecutor
+            with executor_cls(max_workers=n) as executor:
+                future_list = [executor.submit(_call_with_args, func, args) for args in args_list]
                 for future in as_completed(future_list):
                     args, result = future.result()
                     results.append((args, result))
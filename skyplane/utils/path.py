@@ -1,53 +1,89 @@
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 
 from skyplane.utils import logger
 
+_AZURE_HTTPS_RE = re.compile(r"https?://([^/]+)\.blob\.core\.windows\.net/([^/]+)/?(.*)")
+_AZURE_RE = re.compile(r"azure://([^/]+)/([^/]+)/?(.*)")
+_HDFS_RE = re.compile(r"hdfs://([^/]+)/?(.*)")
 
+
+def _parse_bucket_path(path: str, provider: str, parsed: str) -> Tuple[str, Optional[str], Optional[str]]:
+    if len(parsed) == 0:
+        logger.error(f"Invalid S3 path: '{path}'", fg="red", err=True)
+        raise ValueError(f"Invalid S3 path: '{path}'")
+    bucket, *keys = parsed.split("/", 1)
+    key = keys[0] if len(keys) > 0 else ""
+    return provider, bucket, key
+
+
+def _parse_s3(path: str, parsed: str) -> Tuple[str, Optional[str], Optional[str]]:
+    return _parse_bucket_path(path, "aws", parsed)
+
+
+def _parse_gs(path: str, parsed: str) -> Tuple[str, Optional[str], Optional[str]]:
+    return _parse_bucket_path(path, "gcp", parsed)
+
+
+def _parse_azure_https(path: str, parsed: str) -> Optional[Tuple[str, Optional[str], Optional[str]]]:
+    # only Azure blob storage URLs are supported over http(s), anything else falls through to a local path
+    if "blob.core.windows.net" not in parsed:
+        return None
+    match = _AZURE_HTTPS_RE.match(path)
+    if match is None:
+        raise ValueError(f"Invalid Azure path: {path}")
+    account, container, blob_path = match.groups()
+    return "azure", f"{account}/{container}", blob_path
+
+
+def _parse_azure(path: str, parsed: str) -> Tuple[str, Optional[str], Optional[str]]:
+    match = _AZURE_RE.match(path)
+    if match is None:
+        raise ValueError(f"Invalid Azure path: {path}")
+    account, container, blob_path = match.groups()
+    return "azure", f"{account}/{container}", blob_path if blob_path else ""
+
+
+def _parse_hdfs(path: str, parsed: str) -> Tuple[str, Optional[str], Optional[str]]:
+    match = _HDFS_RE.match(path)
+    if match is None:
+        raise ValueError(f"Invalid HDFS path: {path}")
+    host, path = match.groups()
+    return "hdfs", host, path
+
+
+def is_plausible_local_path(path: str) -> bool:
+    path_test = Path(path)
+    if path_test.exists():
+        return True
+    if path_test.is_dir():
+        return True
+    if path_test.parent.exists():
+        return True
+    return False
+
+
+# maps a URL scheme (the text before "://") to its parser
+_SCHEME_DISPATCH = {
+    "s3": _parse_s3,
+    "gs": _parse_gs,
+    "http": _parse_azure_https,
+    "https": _parse_azure_https,
+    "azure": _parse_azure,
+    "hdfs": _parse_hdfs,
+}
+
+
+@lru_cache(maxsize=4096)
 def parse_path(path: str) -> Tuple[str, Optional[str], Optional[str]]:
-    def is_plausible_local_path(path_test: str):
-        path_test = Path(path_test)
-        if path_test.exists():
-            return True
-        if path_test.is_dir():
-            return True
-        if path_test.parent.exists():
-            return True
-        return False
-
-    if path.startswith("s3://") or path.startswith("gs://"):
-        provider, parsed = path[:2], path[5:]
-        if len(parsed) == 0:
-            logger.error(f"Invalid S3 path: '{path}'", fg="red", err=True)
-            raise ValueError(f"Invalid S3 path: '{path}'")
-        bucket, *keys = parsed.split("/", 1)
-        key = keys[0] if len(keys) > 0 else ""
-        provider = "aws" if provider == "s3" else "gcp"
-        return provider, bucket, key
-    elif (path.startswith("https://") or path.startswith("http://")) and "blob.core.windows.net" in path:
-        # Azure blob storage
-        regex = re.compile(r"https?://([^/]+).blob.core.windows.net/([^/]+)/?(.*)")
-        match = regex.match(path)
-        if match is None:
-            raise ValueError(f"Invalid Azure path: {path}")
-        account, container, blob_path = match.groups()
-        return "azure", f"{account}/{container}", blob_path
-    elif path.startswith("azure://"):
-        regex = re.compile(r"azure://([^/]+)/([^/]+)/?(.*)")
-        match = regex.match(path)
-        if match is None:
-            raise ValueError(f"Invalid Azure path: {path}")
-        account, container, blob_path = match.groups()
-        return "azure", f"{account}/{container}", blob_path if blob_path else ""
-    elif path.startswith("hdfs://"):
-        regex = re.compile(r"hdfs://([^/]+)/?(.*)")
-        match = regex.match(path)
-        if match is None:
-            raise ValueError(f"Invalid HDFS path: {path}")
-        host, path = match.groups()
-        return "hdfs", host, path
-    else:
-        if not is_plausible_local_path(path):
-            logger.warning(f"Local path '{path}' does not exist")
-        return "local", None, path
+    scheme, sep, parsed = path.partition("://")
+    parse_fn = _SCHEME_DISPATCH.get(scheme) if sep else None
+    if parse_fn is not None:
+        result = parse_fn(path, parsed)
+        if result is not None:
+            return result
+    if not is_plausible_local_path(path):
+        logger.warning(f"Local path '{path}' does not exist")
+    return "local", None, path
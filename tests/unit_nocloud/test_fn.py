@@ -0,0 +1,52 @@
+import os
+import threading
+import time
+
+from skyplane.utils.fn import cpu_bound, do_parallel, wait_for
+
+
+def square(x):
+    return x * x
+
+
+@cpu_bound
+def worker_pid(_):
+    return os.getpid()
+
+
+def test_do_parallel_thread():
+    assert sorted(do_parallel(square, range(8), return_args=False)) == [x * x for x in range(8)]
+
+
+def test_do_parallel_process():
+    results = do_parallel(square, range(8), mode="process")
+    assert sorted(results) == [(x, x * x) for x in range(8)]
+
+
+def test_do_parallel_auto_uses_process_for_cpu_bound():
+    assert os.getpid() not in do_parallel(worker_pid, range(4), mode="auto", return_args=False)
+    assert do_parallel(lambda _: os.getpid(), range(4), mode="auto", return_args=False) == [os.getpid()] * 4
+
+
+def test_wait_for_polls_no_more_than_fixed_interval():
+    start, n_polls = time.time(), 0
+
+    def ready():
+        nonlocal n_polls
+        n_polls += 1
+        return time.time() - start > 0.5
+
+    wait_for(ready, timeout=5, interval=0.05)
+    assert n_polls <= 0.5 / 0.05 + 2  # a fixed 50ms poll would take 11-12 calls
+
+
+def test_wait_for_notify_event_repolls_early():
+    done, event = threading.Event(), threading.Event()
+
+    def finish():
+        time.sleep(0.1)
+        done.set()
+        event.set()
+
+    threading.Thread(target=finish).start()
+    assert wait_for(done.is_set, timeout=10, interval=5, notify_event=event) < 1